@@ -5,7 +5,6 @@
 
 
 from collections import namedtuple
-import yaml
 
 import ids
 import utils
@@ -23,12 +22,12 @@ _c = utils.Counter()
 instInfoByName = {}
 instInfoByCode = []
 
-with utils.openCommonFile("opcodes.yaml") as _opcodesFile:
-    for _opc in yaml.load(_opcodesFile.read()):
-        _info = InstInfo(_opc["name"], _c(), _opc["iops"],
-                         _opc["push"], _opc["pop"], _opc["term"])
-        instInfoByName[_opc["name"]] = _info
-        instInfoByCode.append(_info)
+_opcodes, = utils.loadCommonYaml("opcodes.yaml")
+for _opc in _opcodes:
+    _info = InstInfo(_opc["name"], _c(), _opc["iops"],
+                     _opc["push"], _opc["pop"], _opc["term"])
+    instInfoByName[_opc["name"]] = _info
+    instInfoByCode.append(_info)
 
 # Instructions and types may have one of the widths below. This number can be added to a base
 # instruction like "addi8" to get the appropriate variant.
@@ -71,14 +70,13 @@ def getBuiltinClassId(index):
     return _classIds[index]
 
 
-with utils.openCommonFile("builtins.yaml") as _builtinsFile:
-    _classes, _functions = yaml.load_all(_builtinsFile.read())
-    for _ty in _classes:
-        _assignClassId(_ty["id"])
-        if not _ty["isPrimitive"]:
-            for _ctor in _ty["constructors"]:
-                _assignFunctionId(_ctor["id"])
-        for _method in _ty["methods"]:
-            _assignFunctionId(_method["id"])
-    for _fn in _functions:
-        _assignFunctionId(_fn["id"])
+_classes, _functions = utils.loadCommonYaml("builtins.yaml")
+for _ty in _classes:
+    _assignClassId(_ty["id"])
+    if not _ty["isPrimitive"]:
+        for _ctor in _ty["constructors"]:
+            _assignFunctionId(_ctor["id"])
+    for _method in _ty["methods"]:
+        _assignFunctionId(_method["id"])
+for _fn in _functions:
+    _assignFunctionId(_fn["id"])
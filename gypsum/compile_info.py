@@ -136,23 +136,30 @@ _dictNames = [("Scope", "scopes", (ids.ScopeId, ids.AstId, ids.DefnId, ids.Packa
               ("ImportInfo", "importInfo", (ids.AstId,)),]
 
 def _addDictMethods(elemName, dictName, types):
+    # These methods are called for nearly every AST node in every pass, so we check which
+    # key types are allowed once, here.
+    isKeyedByAstId = ids.AstId in types
+    isKeyedByDefnId = ids.DefnId in types
+    isKeyedByScopeId = ids.ScopeId in types
+    isKeyedByPackageId = ids.PackageId in types
+
     def cleanKey(self, key):
         if isinstance(key, ast.Node):
             astId = key.id
-            if ids.AstId in types:
+            if isKeyedByAstId:
                 return astId
-            elif ids.DefnId in types and astId in self.defnInfo:
+            elif isKeyedByDefnId and astId in self.defnInfo:
                 return self.defnInfo[astId][0].irDefn.id
-            elif ids.ScopeId in types and astId in self.scopes:
+            elif isKeyedByScopeId and astId in self.scopes:
                 return self.scopes[astId][0].scopeId
             return astId
         elif isinstance(key, ir.IrDefinition):
             defnId = key.id
-            if ids.AstId in types and key.astDefn is not None:
+            if isKeyedByAstId and key.astDefn is not None:
                 return key.astDefn.id
-            elif ids.DefnId in types:
+            elif isKeyedByDefnId:
                 return defnId
-            elif ids.ScopeId in types:
+            elif isKeyedByScopeId:
                 if defnId in self.scopes:
                     return self.scopes[defnId][0].scopeId
                 elif key.astDefn is not None and key.astDefn.id in self.scopes:
@@ -160,21 +167,21 @@ def _addDictMethods(elemName, dictName, types):
             return defnId
         elif isinstance(key, ir.Package):
             packageId = key.id
-            if ids.PackageId in types:
+            if isKeyedByPackageId:
                 return packageId
-            elif ids.ScopeId in types:
+            elif isKeyedByScopeId:
                 return self.scopes[packageId][0].scopeId
         return key
 
     def has(self, key):
         key = cleanKey(self, key)
-        assert any(isinstance(key, type) for type in types)
+        assert isinstance(key, types)
         return key in getattr(self, dictName)
     setattr(CompileInfo, "has" + elemName, has)
 
     def get(self, key):
         key = cleanKey(self, key)
-        assert any(isinstance(key, type) for type in types)
+        assert isinstance(key, types)
         values = getattr(self, dictName)[key]
         assert len(values) == 1
         return values[0]
@@ -182,19 +189,19 @@ def _addDictMethods(elemName, dictName, types):
 
     def getAll(self, key):
         key = cleanKey(self, key)
-        assert any(isinstance(key, type) for type in types)
+        assert isinstance(key, types)
         return getattr(self, dictName)[key]
     setattr(CompileInfo, "getAll" + elemName, getAll)
 
     def set(self, key, value):
         key = cleanKey(self, key)
-        assert any(isinstance(key, type) for type in types)
+        assert isinstance(key, types)
         getattr(self, dictName)[key] = [value]
     setattr(CompileInfo, "set" + elemName, set)
 
     def add(self, key, value):
         key = cleanKey(self, key)
-        assert any(isinstance(key, type) for type in types)
+        assert isinstance(key, types)
         table = getattr(self, dictName)
         if key not in table:
             table[key] = []
@@ -318,6 +325,7 @@ class DefnInfo(data.Data):
         # that weren't imported.
         "importedTypeArguments",
     ]
+    __slots__ = tuple(propertyNames)
 
     def __init__(self, irDefn, scopeId, isVisible,
                  inheritedScopeId=None, inheritanceDepth=0, importedTypeArguments=None):
@@ -374,6 +382,7 @@ class UseInfo(data.Data):
         # captured.
         "kind",
     ]
+    __slots__ = tuple(propertyNames)
 
     def shouldCapture(self, info):
         useScope = info.getScope(self.useScopeId)
@@ -7,6 +7,10 @@
 import utils
 
 class Data(object):
+    # Subclasses that are allocated in large numbers may declare `__slots__` to avoid having
+    # a `__dict__` per instance. That only works if every base declares slots too.
+    __slots__ = ()
+
     @staticmethod
     def makeClass(name, propertyNames):
         return type(name, (Data,), {"propertyNames": propertyNames})
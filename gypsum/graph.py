@@ -129,31 +129,40 @@ class Graph(object):
         return sccGraph
 
     def topologicalSort(self):
-        """Returns a list of vertices in topological order."""
-        # Kahn's algorithm
+        """Returns a list of vertices in topological order. The graph must be acyclic."""
+        order = self.topologicalSortOrNone()
+        assert order is not None
+        return order
+
+    def topologicalSortOrNone(self):
+        """Returns a list of vertices in topological order, or None if the graph is cyclic.
+
+        This also serves as a cycle check, which is cheaper than building the graph of
+        strongly connected components."""
+        # Kahn's algorithm. We read the adjacency sets directly instead of going through
+        # `vertices` and `neighbors`, which copy the key list and add a call per vertex.
+        associations = self.associations
 
         # Count the incoming edges for each node.
-        roots = set(self.vertices())
-        edgeCounts = {v: 0 for v in self.vertices()}
-        totalEdgeCount = 0
-        for v in self.vertices():
-            for w in self.neighbors(v):
-                roots.discard(w)
+        edgeCounts = dict.fromkeys(associations, 0)
+        for neighbors in associations.itervalues():
+            for w in neighbors:
                 edgeCounts[w] += 1
-                totalEdgeCount += 1
+        roots = [v for v, count in edgeCounts.iteritems() if count == 0]
 
         # Build the order.
         order = []
         while len(roots) > 0:
             v = roots.pop()
-            assert edgeCounts[v] == 0
             order.append(v)
-            for w in self.neighbors(v):
-                edgeCounts[w] -= 1
-                totalEdgeCount -= 1
-                if edgeCounts[w] == 0:
-                    roots.add(w)
-        assert totalEdgeCount == 0
+            for w in associations[v]:
+                count = edgeCounts[w] - 1
+                edgeCounts[w] = count
+                if count == 0:
+                    roots.append(w)
+        if len(order) < len(associations):
+            # Vertices on a cycle never run out of incoming edges, so they were never added.
+            return None
         return order
 
     def depthFirstSearch(self, v, callback, colors=None):
@@ -168,7 +177,6 @@ class Graph(object):
         colors[v] = BLACK
 
     def isCyclic(self):
-        sccGraph = self.stronglyConnectedComponents()
-        return len(sccGraph.vertices()) < len(self.vertices())
+        return self.topologicalSortOrNone() is None
 
 __all__ = ["Graph"]
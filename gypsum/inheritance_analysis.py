@@ -5,6 +5,7 @@
 
 
 import ast
+import itertools
 from builtins import registerBuiltins, getNothingClass
 from bytecode import BUILTIN_ROOT_CLASS_ID
 from compile_info import NOT_HERITABLE
@@ -16,7 +17,10 @@ import ir
 from ir_types import ClassType, ExistentialType, VariableType, getRootClassType
 from location import NoLoc
 from scope_analysis import ScopeVisitor, NonLocalObjectTypeDefnScope
-from utils import each
+
+
+_ARRAY_FLAGS = frozenset([ARRAY])
+_ARRAY_FINAL_FLAGS = frozenset([ARRAY_FINAL])
 
 
 def analyzeInheritance(info):
@@ -49,9 +53,11 @@ def analyzeInheritance(info):
         raise InheritanceException(NoLoc, "inheritance cycle detected")
 
     # Build full type lists for each definition. We process each class and trait in
-    # topological order, so all supertype definitions are processed first.
+    # topological order, so all supertype definitions are processed first. Copying inherited
+    # definitions below uses the same order, so we only sort once.
     inheritanceGraph = buildInheritanceGraph(info)
-    bases = buildFullTypeLists(info, inheritanceGraph)
+    topologicalIds = inheritanceGraph.topologicalSort()
+    bases = buildFullTypeLists(info, topologicalIds)
 
     # Perform some type checks on type arguments for inherited types. These checks were
     # deferred from type declaration analysis. After these checks are performed, we can use
@@ -60,7 +66,7 @@ def analyzeInheritance(info):
         info.typeCheckFunction()
 
     # Resolve overrides and copy inherited definitions into classes and traits from bases.
-    copyInheritedDefinitions(info, inheritanceGraph, bases)
+    copyInheritedDefinitions(info, topologicalIds, bases)
 
 
 def buildSubtypeGraph(info):
@@ -71,40 +77,38 @@ def buildSubtypeGraph(info):
     parameters also have edges from their lower bounds and to their upper bounds.
     """
     subtypeGraph = Graph()
+    nothingClass = getNothingClass()
 
-    def addTypeDefn(irTypeDefn):
+    # Classes and traits are iterated separately from type parameters, so we know which kind
+    # of definition we have without checking each one.
+    for irTypeDefn in itertools.chain(info.package.classes, info.package.traits):
         subtypeGraph.addVertex(irTypeDefn.id)
-        if isinstance(irTypeDefn, ir.ObjectTypeDefn):
-            for supertype in irTypeDefn.supertypes:
-                if supertype.isNullable():
-                    raise InheritanceException.fromDefn(irTypeDefn,
-                                                        "cannot inherit nullable type")
-                if supertype.clas is getNothingClass():
-                    raise InheritanceException.fromDefn(irTypeDefn, "cannot inherit Nothing")
-                supertypeId = getIdForType(supertype)
-                if irTypeDefn.id is supertypeId:
-                    raise InheritanceException.fromDefn(irTypeDefn,
-                                                        "cannot inherit from itself")
-                if not supertype.clas.isLocal():
-                    NonLocalObjectTypeDefnScope.ensureForDefn(supertype.clas, info)
-                subtypeGraph.addEdge(irTypeDefn.id, supertypeId)
-        elif isinstance(irTypeDefn, ir.TypeParameter):
-            upperBoundId = getIdForType(irTypeDefn.upperBound)
-            if irTypeDefn.id is upperBoundId:
+        for supertype in irTypeDefn.supertypes:
+            if supertype.isNullable():
                 raise InheritanceException.fromDefn(irTypeDefn,
-                                                    "cannot be upper bounded by itself")
-            subtypeGraph.addEdge(irTypeDefn.id, upperBoundId)
-            lowerBoundId = getIdForType(irTypeDefn.lowerBound)
-            if irTypeDefn.id is lowerBoundId:
+                                                    "cannot inherit nullable type")
+            if supertype.clas is nothingClass:
+                raise InheritanceException.fromDefn(irTypeDefn, "cannot inherit Nothing")
+            supertypeId = getIdForType(supertype)
+            if irTypeDefn.id is supertypeId:
                 raise InheritanceException.fromDefn(irTypeDefn,
-                                                    "cannot be lower bounded by itself")
-            subtypeGraph.addEdge(lowerBoundId, irTypeDefn.id)
-        else:
-            raise NotImplementedError()
+                                                    "cannot inherit from itself")
+            if not supertype.clas.isLocal():
+                NonLocalObjectTypeDefnScope.ensureForDefn(supertype.clas, info)
+            subtypeGraph.addEdge(irTypeDefn.id, supertypeId)
 
-    each(addTypeDefn, info.package.classes)
-    each(addTypeDefn, info.package.traits)
-    each(addTypeDefn, info.package.typeParameters)
+    for irTypeDefn in info.package.typeParameters:
+        subtypeGraph.addVertex(irTypeDefn.id)
+        upperBoundId = getIdForType(irTypeDefn.upperBound)
+        if irTypeDefn.id is upperBoundId:
+            raise InheritanceException.fromDefn(irTypeDefn,
+                                                "cannot be upper bounded by itself")
+        subtypeGraph.addEdge(irTypeDefn.id, upperBoundId)
+        lowerBoundId = getIdForType(irTypeDefn.lowerBound)
+        if irTypeDefn.id is lowerBoundId:
+            raise InheritanceException.fromDefn(irTypeDefn,
+                                                "cannot be lower bounded by itself")
+        subtypeGraph.addEdge(lowerBoundId, irTypeDefn.id)
 
     return subtypeGraph
 
@@ -118,14 +122,14 @@ def buildInheritanceGraph(info):
     is the opposite direction compared to the subtype graph.
     """
     inheritanceGraph = Graph()
-    for irDefn in info.package.classes + info.package.traits:
+    for irDefn in itertools.chain(info.package.classes, info.package.traits):
         inheritanceGraph.addVertex(irDefn.id)
         for supertype in irDefn.supertypes:
             inheritanceGraph.addEdge(getIdForType(supertype), irDefn.id)
     return inheritanceGraph
 
 
-def buildFullTypeLists(info, inheritanceGraph):
+def buildFullTypeLists(info, topologicalIds):
     """Builds full `supertypes` lists for each class and trait in the package being compiled.
 
     Each class and trait has a `supertypes` list, which contains exactly one type for each
@@ -138,13 +142,32 @@ def buildFullTypeLists(info, inheritanceGraph):
         Redundant inheritances are removed. For example, if Foo inherits Bar and Baz, but
         Bar already inherits Baz, the list for Foo will just contain Bar.
     """
-    topologicalIds = inheritanceGraph.topologicalSort()
     bases = {}
-    for id in topologicalIds:
-        if not id.isLocal():
+
+    # Maps class ids to the ids of all classes and traits they derive from, including
+    # themselves. This replaces `Class.isDerivedFrom`, which compares definitions
+    # structurally. Since we process definitions in topological order, supertype lists are
+    # complete by the time we look up a base class here.
+    ancestorIdMap = {}
+    def getAncestorIds(irClass):
+        ancestorIds = ancestorIdMap.get(irClass.id)
+        if ancestorIds is None:
+            ancestorIds = frozenset([irClass.id] + [st.clas.id for st in irClass.supertypes])
+            ancestorIdMap[irClass.id] = ancestorIds
+        return ancestorIds
+
+    # Caches substituted ubertypes by supertype and base definition. Supertypes are usually
+    # inherited by many definitions, and their types are hash-consed, so the same pair comes
+    # up repeatedly.
+    substitutedTypeCache = {}
+
+    nothingClass = getNothingClass()
+    rootClassType = getRootClassType()
+    for defnId in topologicalIds:
+        if not defnId.isLocal():
             continue
-        irDefn = info.package.getDefn(id)
-        bases[id] = []
+        irDefn = info.package.getDefn(defnId)
+        bases[defnId] = []
 
         # This maps class and trait ids to inherited types. It's possible to inherit a class or
         # trait through multiple paths (diamond inheritance). This is used to make sure the
@@ -156,14 +179,16 @@ def buildFullTypeLists(info, inheritanceGraph):
         # full graph traversal to build this.
         inheritedTypes = []
 
-        # Check that we don't explicitly inherit the same definition more than once.
-        explicitInheritedIds = set()
-        for supertype in irDefn.supertypes:
-            if supertype.clas.id in explicitInheritedIds:
-                raise InheritanceException.fromDefn(irDefn,
-                                                    "inherited same definition more than once: %s" %
-                                                    supertype.clas.getSourceName())
-            explicitInheritedIds.add(supertype.clas.id)
+        # Check that we don't explicitly inherit the same definition more than once. Most
+        # definitions have a single supertype, so there is nothing to check.
+        if len(irDefn.supertypes) > 1:
+            explicitInheritedIds = set()
+            for supertype in irDefn.supertypes:
+                if supertype.clas.id in explicitInheritedIds:
+                    raise InheritanceException.fromDefn(irDefn,
+                                                        "inherited same definition more than once: %s" %
+                                                        supertype.clas.getSourceName())
+                explicitInheritedIds.add(supertype.clas.id)
 
         # Ensure that the first inherited type is from a class. This need not be explicit in
         # source code. For classes, if the first supertype in source code is a trait, the
@@ -173,7 +198,7 @@ def buildFullTypeLists(info, inheritanceGraph):
         assert len(irDefn.supertypes) > 0
         if isinstance(irDefn.supertypes[0].clas, ir.Trait):
             if isinstance(irDefn, ir.Class):
-                baseClassType = getRootClassType()
+                baseClassType = rootClassType
             else:
                 baseClassType = irDefn.supertypes[0].clas.supertypes[0].substitute(
                     irDefn.supertypes[0].clas.typeParameters,
@@ -201,7 +226,8 @@ def buildFullTypeLists(info, inheritanceGraph):
             irSuperClass = irSuperDefn \
                            if isinstance(irSuperDefn, ir.Class) \
                            else irSuperDefn.supertypes[0].clas
-            if not baseClassType.clas.isDerivedFrom(irSuperClass):
+            if baseClassType.clas is not nothingClass and \
+               irSuperClass.id not in getAncestorIds(baseClassType.clas):
                 raise InheritanceException.fromDefn(irDefn,
                                                     "base class %s of supertype %s not a superclass of base class %s" %
                                                     (irSuperClass.getSourceName(),
@@ -209,10 +235,13 @@ def buildFullTypeLists(info, inheritanceGraph):
                                                      baseClassType.clas.getSourceName()))
             isFirstSupertype = False
 
-            if irSuperDefn.id in inheritedTypeMap:
+            inheritedType = inheritedTypeMap.get(irSuperDefn.id)
+            if inheritedType is not None:
                 # We have already inherited this type along a different path. We do not need
                 # to copy bindings.
-                if inheritedTypeMap[irSuperDefn.id] != supertype:
+                # Class types are hash-consed, so types inherited along different paths are
+                # usually the same object. Fall back to structural comparison otherwise.
+                if inheritedType is not supertype and inheritedType != supertype:
                     raise InheritanceException.fromDefn(irDefn,
                                                         "inherited %s multiple times with different types" %
                                                         irSuperDefn.getSourceName())
@@ -220,17 +249,23 @@ def buildFullTypeLists(info, inheritanceGraph):
                 # We have not inherited this type yet.
                 inheritedTypeMap[irSuperDefn.id] = supertype
                 inheritedTypes.append(supertype)
-                bases[id].append(irSuperDefn.id)
+                bases[defnId].append(irSuperDefn.id)
 
                 # Inherit types from the supertype ("ubertypes"). We don't need to do this
                 # recursively we processed the supertype in a previous iteration. Its supertypes
                 # list already contains everything it inherits from.
                 for ubertype in irSuperDefn.supertypes:
                     irUberDefn = ubertype.clas
-                    substitutedUbertype = supertype.substituteForBase(irUberDefn)
-                    if irUberDefn.id in inheritedTypeMap:
+                    key = (id(supertype), irUberDefn.id)
+                    substitutedUbertype = substitutedTypeCache.get(key)
+                    if substitutedUbertype is None:
+                        substitutedUbertype = supertype.substituteForBase(irUberDefn)
+                        substitutedTypeCache[key] = substitutedUbertype
+                    inheritedType = inheritedTypeMap.get(irUberDefn.id)
+                    if inheritedType is not None:
                         # We have already inherited this definition along a different path.
-                        if inheritedTypeMap[irUberDefn.id] != substitutedUbertype:
+                        if inheritedType is not substitutedUbertype and \
+                           inheritedType != substitutedUbertype:
                             raise InheritanceException.fromDefn(irDefn,
                                                                 "inherited %s multiple times with different types" %
                                                                 irUberDefn.getSourceName())
@@ -244,7 +279,7 @@ def buildFullTypeLists(info, inheritanceGraph):
     return bases
 
 
-def copyInheritedDefinitions(info, inheritanceGraph, bases):
+def copyInheritedDefinitions(info, topologicalIds, bases):
     """Resolves overrides and copies inherited definitions from bases to classes and traits.
 
     A method may override methods in inherited scopes if it has the same name and compatible
@@ -260,86 +295,116 @@ def copyInheritedDefinitions(info, inheritanceGraph, bases):
 
     For classes specifically, we also copy the ARRAY and ARRAY_FINAL flags from base classes.
     """
-    topologicalIds = inheritanceGraph.topologicalSort()
-    for id in topologicalIds:
-        if not id.isLocal():
+    # Maps scope ids of bases to dicts of their heritable names. A base's bindings don't change
+    # after it has been processed, so we only need to check which names are heritable once,
+    # even if the base is inherited many times.
+    heritableNameMaps = {}
+    def getHeritableNames(superScope):
+        heritableNames = heritableNameMaps.get(superScope.scopeId)
+        if heritableNames is None:
+            heritableNames = {nameInfo.name: nameInfo
+                              for nameInfo in superScope.iterNameInfo()
+                              if nameInfo.isHeritable()}
+            heritableNameMaps[superScope.scopeId] = heritableNames
+        return heritableNames
+
+    for defnId in topologicalIds:
+        if not defnId.isLocal():
             continue
-        scope = info.getScope(id)
+        scope = info.getScope(defnId)
         irScopeDefn = scope.getIrDefn()
-        superScopes = [info.getScope(baseId) for baseId in bases[id]]
+        superScopes = [info.getScope(baseId) for baseId in bases[defnId]]
+        superHeritableNames = [getHeritableNames(superScope) for superScope in superScopes]
         overriddenIds = set()
 
         for name, defnInfo in scope.iterBindings():
             if name == "this":
                 continue
             irDefn = defnInfo.irDefn
+            isOverride = OVERRIDE in irDefn.flags
+            isOverrideCandidate = isinstance(irDefn, ir.Function) and \
+                                  not irDefn.isConstructor() and \
+                                  STATIC not in irDefn.flags
             overrides = []
             inheritedIds = set()
-            for superScope in superScopes:
-                nameInfo = superScope.getDefinition(name)
-                if nameInfo is None or not nameInfo.isHeritable():
+            for heritableNames in superHeritableNames:
+                nameInfo = heritableNames.get(name)
+                if nameInfo is None:
                     continue
                 if not nameInfo.isOverloadable(defnInfo):
                     raise InheritanceException.fromDefn(irDefn,
                                                         "cannot overload definition in base")
-                if isinstance(irDefn, ir.Function) and \
-                   not irDefn.isConstructor() and \
-                   not STATIC in irDefn.flags:
+                if isOverrideCandidate:
                     for superDefnInfo in nameInfo.overloads:
                         assert superDefnInfo.isHeritable()
                         superIrDefn = superDefnInfo.irDefn
-                        if superIrDefn.id in inheritedIds:
+                        superId = superIrDefn.id
+                        if superId in inheritedIds:
                             continue
-                        inheritedIds.add(superIrDefn.id)
+                        inheritedIds.add(superId)
                         if irDefn.mayOverride(superIrDefn):
                             if superIrDefn.isFinal():
                                 raise InheritanceException.fromDefn(irDefn,
                                                                     "cannot override a final method")
-                            if id in superIrDefn.overriddenBy:
+                            overriddenBy = superIrDefn.overriddenBy
+                            if defnId in overriddenBy:
                                 raise InheritanceException.fromDefn(irDefn,
                                                                     "multiple methods in this class override the same base method")
                             overrides.append(superIrDefn)
-                            overriddenIds.add(superIrDefn.id)
-                            superIrDefn.overriddenBy[id] = irDefn
-            if OVERRIDE in irDefn.flags and len(overrides) == 0:
+                            overriddenIds.add(superId)
+                            overriddenBy[defnId] = irDefn
+            if isOverride and len(overrides) == 0:
                 raise InheritanceException.fromDefn(irDefn,
                                                     "doesn't actually override anything")
-            if OVERRIDE not in irDefn.flags and len(overrides) > 0:
+            if not isOverride and len(overrides) > 0:
                 raise InheritanceException.fromDefn(irDefn,
                                                     "overrides methods without `override` attribute")
             if len(overrides) > 0:
                 irDefn.overrides = overrides
 
+        # Names and definitions already bound in this scope, so we can skip them without
+        # searching overloads each time. Definitions inherited through more than one base are
+        # added as they are bound.
+        boundKeys = set((name, id(defnInfo.irDefn)) for name, defnInfo in scope.iterBindings())
+        isConcreteClass = isinstance(irScopeDefn, ir.Class) and \
+                          ABSTRACT not in irScopeDefn.flags
         for superScope in superScopes:
             for name, defnInfo in superScope.iterBindings():
+                irDefn = defnInfo.irDefn
+                key = (name, id(irDefn))
                 if (not defnInfo.isHeritable() or
-                    scope.isBound(name, defnInfo.irDefn) or
-                    (isinstance(defnInfo.irDefn, ir.IrTopDefn) and
-                     defnInfo.irDefn.id in overriddenIds)):
+                    key in boundKeys or
+                    (isinstance(irDefn, ir.IrTopDefn) and irDefn.id in overriddenIds)):
                     continue
-                if isinstance(irScopeDefn, ir.Class) and \
-                   ABSTRACT not in irScopeDefn.flags and \
-                   isinstance(defnInfo.irDefn, ir.Function) and \
-                   ABSTRACT in defnInfo.irDefn.flags:
+                if isConcreteClass and \
+                   isinstance(irDefn, ir.Function) and \
+                   ABSTRACT in irDefn.flags:
                     raise InheritanceException.fromDefn(irScopeDefn,
                                                         "concrete class does not override abstract method: %s" %
-                                                        defnInfo.irDefn.getSourceName())
+                                                        irDefn.getSourceName())
                 scope.bind(name, defnInfo.inherit(scope.scopeId))
+                boundKeys.add(key)
 
         if isinstance(irScopeDefn, ir.Class):
             superclass = irScopeDefn.superclass()
             if ARRAY in superclass.flags:
-                irScopeDefn.flags |= frozenset([ARRAY])
+                irScopeDefn.flags |= _ARRAY_FLAGS
             if ARRAY_FINAL in superclass.flags:
-                irScopeDefn.flags |= frozenset([ARRAY_FINAL])
+                irScopeDefn.flags |= _ARRAY_FINAL_FLAGS
 
 
 def getIdForType(ty):
-    if isinstance(ty, ClassType):
-        return ty.clas.id
-    elif isinstance(ty, VariableType):
-        return ty.typeParameter.id
-    elif isinstance(ty, ExistentialType):
-        return getIdForType(id.id)
-    else:
+    getId = _idForTypeDispatch.get(type(ty))
+    if getId is None:
         raise NotImplementedError()
+    return getId(ty)
+
+
+# Maps type classes to functions returning the id of the definition a type refers to. These
+# classes have no subclasses, so `getIdForType` can look up `type(ty)` directly instead of
+# checking `isinstance` for each one.
+_idForTypeDispatch = {
+    ClassType: lambda ty: ty.clas.id,
+    VariableType: lambda ty: ty.typeParameter.id,
+    ExistentialType: lambda ty: getIdForType(ty.ty),
+}
@@ -603,6 +603,8 @@ class Function(ParameterizedDefn):
         return buf.getvalue()
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return self.name == other.name and \
                self.returnType == other.returnType and \
                self.typeParameters == other.typeParameters and \
@@ -1358,15 +1360,18 @@ def unmangleNameForTest(name):
 
 
 def _findDefn(defns, kwargs):
+    # A name given as a string is parsed once here, rather than once for each definition.
+    name = kwargs.get("name")
+    sourceName = None
+    if isinstance(name, str):
+        sourceName = name
+        name = Name.fromString(name)
+
     def matchItem(defn, key, value):
         if key == "name":
-            if isinstance(value, str):
-                name = Name.fromString(value)
-            else:
-                name = value
             return name == defn.name or \
                 name == unmangleNameForTest(defn.name) or \
-                (isinstance(value, str) and defn.sourceName == value)
+                (sourceName is not None and defn.sourceName == sourceName)
         elif key == "flag":
             return value in defn.flags
         elif key == "pred":
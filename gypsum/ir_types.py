@@ -6,6 +6,7 @@
 
 import copy
 import StringIO
+import weakref
 
 import builtins
 import bytecode
@@ -17,14 +18,20 @@ import utils
 
 NULLABLE_TYPE_FLAG = "nullable"
 
+
+def _canonicalizeFlags(flags):
+    if flags is None:
+        return frozenset()
+    if isinstance(flags, str):
+        return frozenset([flags])
+    return flags
+
+
 class Type(data.Data):
     propertyNames = ("flags",)
 
     def __init__(self, flags=None):
-        if flags is None:
-            flags = frozenset()
-        if isinstance(flags, str):
-            flags = frozenset([flags])
+        flags = _canonicalizeFlags(flags)
         assert isinstance(flags, frozenset)
         self.flags = flags
 
@@ -548,10 +555,29 @@ class ClassType(ObjectType,):
     propertyNames = Type.propertyNames + ("clas", "typeArguments")
     width = bytecode.WORD
 
+    # Class types are hash-consed: constructing a type with the same class, type arguments,
+    # and flags as a live instance returns that instance, so most equality checks end at the
+    # identity test in `__eq__`. Keys are built from object identities, not `__hash__`, since
+    # definition names may change during compilation. Each instance keeps its class and type
+    # arguments alive, so their ids can't be reused while the entry exists.
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, clas=None, typeArguments=(), flags=None):
+        if clas is None:
+            # `copy.copy` creates the new object without arguments.
+            return super(ClassType, cls).__new__(cls)
+        assert isinstance(typeArguments, (tuple, list))
+        key = (id(clas), tuple(id(arg) for arg in typeArguments), _canonicalizeFlags(flags))
+        ty = cls._instances.get(key)
+        if ty is None:
+            ty = super(ClassType, cls).__new__(cls)
+            cls._instances[key] = ty
+        return ty
+
     def __init__(self, clas, typeArguments=(), flags=None):
         super(ClassType, self).__init__(flags)
         self.clas = clas
-        self.typeArguments = typeArguments
+        self.typeArguments = tuple(typeArguments)
 
     @staticmethod
     def forReceiver(clas):
@@ -579,6 +605,8 @@ class ClassType(ObjectType,):
                         [self.clas.name, self.typeArguments])
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return self.__class__ is other.__class__ and \
                self.flags == other.flags and \
                self.clas is other.clas and \
@@ -626,6 +654,20 @@ class VariableType(ObjectType):
     propertyNames = Type.propertyNames + ("typeParameter",)
     width = bytecode.WORD
 
+    # Variable types are hash-consed the same way as `ClassType`.
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, typeParameter=None, flags=frozenset()):
+        if typeParameter is None:
+            # `copy.copy` creates the new object without arguments.
+            return super(VariableType, cls).__new__(cls)
+        key = (id(typeParameter), _canonicalizeFlags(flags))
+        ty = cls._instances.get(key)
+        if ty is None:
+            ty = super(VariableType, cls).__new__(cls)
+            cls._instances[key] = ty
+        return ty
+
     def __init__(self, typeParameter, flags=frozenset()):
         super(VariableType, self).__init__(flags)
         self.typeParameter = typeParameter
@@ -640,6 +682,8 @@ class VariableType(ObjectType):
         return utils.hashList([self.typeParameter.name])
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return self.__class__ is other.__class__ and \
                self.typeParameter == other.typeParameter and \
                self.flags == other.flags
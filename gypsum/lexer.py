@@ -29,59 +29,12 @@ _expressions = [
     (r">:",  SUPERTYPE),
     (r"=>",  BIG_ARROW),
     (r"->",  SMALL_ARROW),
-    (r"_",   UNDERSCORE),
     (r"\.",  DOT),
     (r",",   COMMA),
     (r":",   COLON),
     (r";",   SEMI),
     (r"=",   EQ),
 
-    (r"var", VAR),
-    (r"let", LET),
-    (r"def", DEF),
-    (r"class", CLASS),
-    (r"trait", TRAIT),
-    (r"arrayelements", ARRAYELEMENTS),
-    (r"import", IMPORT),
-    (r"as", AS),
-    (r"if", IF),
-    (r"else", ELSE),
-    (r"while", WHILE),
-    (r"break", BREAK),
-    (r"continue", CONTINUE),
-    (r"case", CASE),
-    (r"match", MATCH),
-    (r"throw", THROW),
-    (r"try", TRY),
-    (r"catch", CATCH),
-    (r"finally", FINALLY),
-    (r"new", NEW),
-    (r"lambda", LAMBDA),
-    (r"return", RETURN),
-    (r"unit", UNIT),
-    (r"i8", I8),
-    (r"i16", I16),
-    (r"i32", I32),
-    (r"i64", I64),
-    (r"f32", F32),
-    (r"f64", F64),
-    (r"boolean", BOOLEAN),
-    (r"forsome", FORSOME),
-    (r"true", TRUE),
-    (r"false", FALSE),
-    (r"this", THIS),
-    (r"super", SUPER),
-    (r"null", NULL),
-
-    (r"abstract", ATTRIB),
-    (r"final", ATTRIB),
-    (r"public", ATTRIB),
-    (r"protected", ATTRIB),
-    (r"private", ATTRIB),
-    (r"static", ATTRIB),
-    (r"override", ATTRIB),
-    (r"native", ATTRIB),
-
     (r"[+-]?[0-9]+(?:i[0-9]+)?", INTEGER),
     (r"[+-]?0[xX][0-9A-Fa-f]+(?:i[0-9]+)?", INTEGER),
     (r"[+-]?0[bB][01]+(?:i[0-9]+)?", INTEGER),
@@ -101,6 +54,57 @@ _expressions = [(re.compile(expr[0]), expr[1]) for expr in _expressions]
 _spaceRx = _expressions[0][0]
 _newlineRx = _expressions[1][0]
 
+# Keywords and attributes are also matched by the symbol expression above, with the same
+# length. When that happens, the keyword takes precedence. Looking up matched symbols here is
+# equivalent to trying a separate expression for each keyword, but much faster.
+_keywords = {
+    "_": UNDERSCORE,
+    "var": VAR,
+    "let": LET,
+    "def": DEF,
+    "class": CLASS,
+    "trait": TRAIT,
+    "arrayelements": ARRAYELEMENTS,
+    "import": IMPORT,
+    "as": AS,
+    "if": IF,
+    "else": ELSE,
+    "while": WHILE,
+    "break": BREAK,
+    "continue": CONTINUE,
+    "case": CASE,
+    "match": MATCH,
+    "throw": THROW,
+    "try": TRY,
+    "catch": CATCH,
+    "finally": FINALLY,
+    "new": NEW,
+    "lambda": LAMBDA,
+    "return": RETURN,
+    "unit": UNIT,
+    "i8": I8,
+    "i16": I16,
+    "i32": I32,
+    "i64": I64,
+    "f32": F32,
+    "f64": F64,
+    "boolean": BOOLEAN,
+    "forsome": FORSOME,
+    "true": TRUE,
+    "false": FALSE,
+    "this": THIS,
+    "super": SUPER,
+    "null": NULL,
+    "abstract": ATTRIB,
+    "final": ATTRIB,
+    "public": ATTRIB,
+    "protected": ATTRIB,
+    "private": ATTRIB,
+    "static": ATTRIB,
+    "override": ATTRIB,
+    "native": ATTRIB,
+}
+
 
 def lex(filename, source):
     tokens = []
@@ -198,6 +202,9 @@ def lex(filename, source):
             column += len(bestText)
             pos += len(bestText)
 
+            if bestTag is SYMBOL:
+                bestTag = _keywords.get(bestText, SYMBOL)
+
             # Ignore whitespace.
             if bestTag is _SPACE:
                 continue
@@ -208,6 +215,11 @@ def lex(filename, source):
                 column = 1
                 continue
 
+            # Symbols become keys in scope bindings and components of names. Interning them
+            # lets dict lookups and comparisons succeed on identity.
+            if bestTag is SYMBOL and isinstance(bestText, str):
+                bestText = intern(bestText)
+
             tok = Token(bestText, bestTag, loc)
 
             # Check nesting.
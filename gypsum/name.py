@@ -71,15 +71,16 @@ class Name(object):
 
 # Strings used in internal names for generated definitions.
 # Use CompileInfo.makeUniqueName to generate internal names that won't conflict with each other.
-CLOSURE_SUFFIX = "$closure"
-CONSTRUCTOR_SUFFIX = "$constructor"
-CONTEXT_SUFFIX = "$context"
-PACKAGE_INIT_NAME = Name(["$pkginit"])
-CLASS_INIT_SUFFIX = "$init"
-ANON_PARAMETER_SUFFIX = "$parameter"
-RECEIVER_SUFFIX = "$this"
-ARRAY_LENGTH_SUFFIX = "$length"
-EXISTENTIAL_SUFFIX = "$forsome"
-BLANK_SUFFIX = "$blank"
-LOCAL_SUFFIX = "$local"
-LAMBDA_SUFFIX = "$lambda"
+# Python only interns literals that look like identifiers, so these are interned explicitly.
+CLOSURE_SUFFIX = intern("$closure")
+CONSTRUCTOR_SUFFIX = intern("$constructor")
+CONTEXT_SUFFIX = intern("$context")
+PACKAGE_INIT_NAME = Name([intern("$pkginit")])
+CLASS_INIT_SUFFIX = intern("$init")
+ANON_PARAMETER_SUFFIX = intern("$parameter")
+RECEIVER_SUFFIX = intern("$this")
+ARRAY_LENGTH_SUFFIX = intern("$length")
+EXISTENTIAL_SUFFIX = intern("$forsome")
+BLANK_SUFFIX = intern("$blank")
+LOCAL_SUFFIX = intern("$local")
+LAMBDA_SUFFIX = intern("$lambda")
@@ -175,6 +175,8 @@ def isHeritable(irDefn):
 
 
 class NameInfo(object):
+    __slots__ = ("name", "overloads")
+
     def __init__(self, name):
         # A str for the name being tracked.
         self.name = name
@@ -585,8 +587,10 @@ class Scope(ast.NodeVisitor):
         For overloaded symbols, there may be several functions in there. If the symbol is not
         found, a ScopeException is raised. Callers should call `use` if they actually use
         the symbol."""
+        # This is the same as calling `isBound` on each scope, but lookups happen for every
+        # symbol reference, and the chain of parent scopes can be long.
         defnScope = self
-        while defnScope is not None and not defnScope.isBound(name):
+        while defnScope is not None and name not in defnScope.bindings:
             defnScope = defnScope.parent
         if defnScope is None:
             if mayBeAssignment and name.endswith("=") and name != "==":
@@ -1843,12 +1847,50 @@ class NonLocalObjectTypeDefnScope(Scope):
 
 
 class BuiltinClassScope(NonLocalObjectTypeDefnScope):
+    # Builtin classes are the same for every compilation, and every `CompileInfo` creates
+    # scopes for all of them. We resolve inherited fields and methods once per class and
+    # rebuild `DefnInfo` for later scopes from this cache. Scope ids are distinct objects in
+    # each compilation, so instead of the inherited scope id, we store the id of the class
+    # the member was inherited from.
+    #
+    # {(DefnId, str): [(IrDefinition, bool, DefnId, int)]}
+    memberCache = {}
+
     def __init__(self, classDefnInfo, info):
         irClass = classDefnInfo.irDefn
         scopeId = ScopeId("builtin-" + irClass.name.short())
         super(BuiltinClassScope, self).__init__(scopeId, irClass, info)
         self.defnInfo = classDefnInfo
 
+    def bindFields(self):
+        self.bindCachedMembers("fields", self.flatFields,
+                               super(BuiltinClassScope, self).bindFields)
+
+    def bindMethods(self):
+        self.bindCachedMembers("methods", self.flatMethods,
+                               super(BuiltinClassScope, self).bindMethods)
+
+    def bindCachedMembers(self, kind, flatDefnInfos, bindUncached):
+        key = (self.irDefn.id, kind)
+        members = BuiltinClassScope.memberCache.get(key)
+        if members is None:
+            bindUncached()
+            BuiltinClassScope.memberCache[key] = \
+                [(defnInfo.irDefn, defnInfo.isVisible,
+                  self.info.getScope(defnInfo.inheritedScopeId).irDefn.id,
+                  defnInfo.inheritanceDepth)
+                 for defnInfo in flatDefnInfos]
+            return
+
+        for irDefn, isVisible, inheritedClassId, inheritanceDepth in members:
+            inheritedScopeId = self.info.getScope(inheritedClassId).scopeId
+            defnInfo = DefnInfo(irDefn, self.scopeId, isVisible,
+                                inheritedScopeId, inheritanceDepth)
+            name = irDefn.sourceName
+            self.bind(name, defnInfo)
+            self.define(name)
+            flatDefnInfos.append(defnInfo)
+
     def getDefnInfo(self):
         return self.defnInfo
 
@@ -7,6 +7,7 @@
 import unittest
 
 import ast
+from builtins import getBuiltinClasses
 from lexer import *
 from parser import *
 from compile_info import *
@@ -814,6 +815,46 @@ class TestPackageScope(unittest.TestCase):
         self.assertIs(publicField, defnInfo.irDefn)
         self.assertRaises(ScopeException, classScope.lookupFromSelf, "y", NoLoc)
 
+    def testBuiltinClassScopesAreRebuiltForEachCompilation(self):
+        def makeBuiltinScopes():
+            info = CompileInfo(None, Package(id=TARGET_PACKAGE_ID), FakePackageLoader([]))
+            topPackageScope = PackageScope(PACKAGE_SCOPE_ID, None, info, [], [], None)
+            BuiltinGlobalScope(topPackageScope)
+            return [info.getScope(clas.id) for clas in getBuiltinClasses(False)]
+
+        # Scope ids are different objects in each compilation, so we compare the classes of
+        # the scopes they identify.
+        def describe(scope, defnInfo):
+            return (defnInfo.irDefn,
+                    scope.info.getScope(defnInfo.scopeId).getIrDefn(),
+                    defnInfo.isVisible,
+                    scope.info.getScope(defnInfo.inheritedScopeId).getIrDefn(),
+                    defnInfo.inheritanceDepth)
+
+        # Other tests may have filled the member cache already. Start with an empty one so the
+        # first compilation binds members without it, and put the old cache back afterward.
+        memberCache = BuiltinClassScope.memberCache
+        savedMembers = dict(memberCache)
+        memberCache.clear()
+        self.addCleanup(memberCache.update, savedMembers)
+        self.addCleanup(memberCache.clear)
+
+        firstScopes = makeBuiltinScopes()
+        self.assertNotEquals({}, memberCache)
+        secondScopes = makeBuiltinScopes()
+        for firstScope, secondScope in zip(firstScopes, secondScopes):
+            self.assertIsNot(firstScope, secondScope)
+            memberLists = ((firstScope.flatFields, secondScope.flatFields),
+                           (firstScope.flatMethods, secondScope.flatMethods))
+            for firstDefnInfos, secondDefnInfos in memberLists:
+                self.assertEquals([describe(firstScope, d) for d in firstDefnInfos],
+                                  [describe(secondScope, d) for d in secondDefnInfos])
+                for firstDefnInfo, secondDefnInfo in zip(firstDefnInfos, secondDefnInfos):
+                    self.assertIsNot(firstDefnInfo, secondDefnInfo)
+                    name = secondDefnInfo.irDefn.sourceName
+                    self.assertIn(secondDefnInfo,
+                                  secondScope.lookupFromSelf(name, NoLoc).overloads)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,6 +31,15 @@ class TestGraph(unittest.TestCase):
         sort = G.topologicalSort()
         self.assertTrue([1, 2, 3, 4, 5] == sort or [1, 2, 4, 3, 5] == sort)
 
+    def testTopologicalSortOrNoneCyclic(self):
+        G = Graph([1, 2, 3, 4], [(1, 2), (2, 3), (3, 2), (3, 4)])
+        self.assertIsNone(G.topologicalSortOrNone())
+        self.assertTrue(G.isCyclic())
+
+    def testIsCyclicSelfLoop(self):
+        self.assertTrue(Graph([1], [(1, 1)]).isCyclic())
+        self.assertFalse(Graph([1, 2], [(1, 2)]).isCyclic())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,14 +10,20 @@ from builtins import getRootClass
 from compile_info import CompileInfo
 import ids
 from ir import Package, PackageDependency
-from ir_types import ClassType, getRootClassType, getExceptionClassType
+from ir_types import (
+    ClassType,
+    ExistentialType,
+    VariableType,
+    getExceptionClassType,
+    getRootClassType,
+)
 from errors import InheritanceException
 from flags import *
 from lexer import lex
 from parser import parse
 from scope_analysis import analyzeDeclarations
 from type_analysis import analyzeTypeDeclarations
-from inheritance_analysis import analyzeInheritance
+from inheritance_analysis import analyzeInheritance, getIdForType
 from utils_test import FakePackageLoader
 from name import CONSTRUCTOR_SUFFIX, Name
 
@@ -620,6 +626,31 @@ class TestInheritanceAnalysis(unittest.TestCase):
                  "class Bar <: Foo"
         self.assertRaises(InheritanceException, self.analyzeFromSource, source)
 
+    def testInheritTraitWithSuperclassOfBaseClass(self):
+        source = ("class A\n"
+                  "trait T <: A\n"
+                  "class B <: A\n"
+                  "class C <: B, T")
+        info = self.analyzeFromSource(source)
+        C = info.package.findClass(name="C")
+        T = info.package.findTrait(name="T")
+        self.assertIn(ClassType(T), C.supertypes)
+
+    def testInheritTraitWithUnrelatedBaseClass(self):
+        source = ("class A\n"
+                  "trait T <: A\n"
+                  "class B\n"
+                  "class C <: B, T")
+        self.assertRaises(InheritanceException, self.analyzeFromSource, source)
+
+    def testGetIdForExistentialType(self):
+        source = "class Foo[static T]"
+        info = self.analyzeFromSource(source)
+        Foo = info.package.findClass(name="Foo")
+        T = info.package.findTypeParameter(name="Foo.T")
+        ty = ExistentialType((T,), ClassType(Foo, (VariableType(T),)))
+        self.assertEquals(Foo.id, getIdForType(ty))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -456,6 +456,24 @@ class TestIrTypes(unittest.TestCase):
         eTy = ExistentialType([S], ExistentialType([T], pTy))
         self.assertEquals((pTy, [S, T]), eTy.effectiveClassType())
 
+    def testClassTypesAreHashConsed(self):
+        xTy = VariableType(self.X)
+        self.assertIs(xTy, VariableType(self.X))
+        pTy = ClassType(self.P, (xTy, ClassType(self.A)))
+        self.assertIs(pTy, ClassType(self.P, [VariableType(self.X), ClassType(self.A)]))
+        self.assertIsNot(pTy, ClassType(self.P, (xTy, ClassType(self.A)), NULLABLE_TYPE_FLAG))
+
+    def testCopiedClassTypeIsDistinct(self):
+        aTy = ClassType(self.A)
+        nullableATy = aTy.withFlag(NULLABLE_TYPE_FLAG)
+        self.assertIsNot(aTy, nullableATy)
+        self.assertEquals(frozenset(), aTy.flags)
+        self.assertEquals(ClassType(self.A, (), NULLABLE_TYPE_FLAG), nullableATy)
+
+    def testClassTypeRejectsGeneratorTypeArguments(self):
+        xTy = VariableType(self.X)
+        self.assertRaises(AssertionError, ClassType, self.P, (t for t in [xTy, xTy]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -62,8 +62,9 @@ class TestUseAnalysis(TestCaseWithDefinitions):
         source = "def f = g\n" + \
                  "def g = 12"
         info = self.analyzeFromSource(source)
-        gDefnInfo = info.getDefnInfo(info.ast.modules[0].definitions[1])
-        gNameInfo = info.getScope(info.ast.modules[0].definitions[0]).lookupFromSelf("g", NoLoc)
+        definitions = info.ast.modules[0].definitions
+        gDefnInfo = info.getDefnInfo(definitions[1])
+        gNameInfo = info.getScope(definitions[0]).lookupFromSelf("g", NoLoc)
         self.assertIs(gDefnInfo, gNameInfo.getDefnInfo())
 
     def testUseCapturedVarBeforeDefinition(self):
@@ -128,9 +129,9 @@ class TestUseAnalysis(TestCaseWithDefinitions):
                  "  private def f = ()\n" + \
                  "  def g = f"
         info = self.analyzeFromSourceWithTypes(source)
-        use = info.getUseInfo(info.ast.modules[0].definitions[0].members[1].body)
-        self.assertEquals(info.getScope(info.ast.modules[0].definitions[0].members[1]).scopeId,
-                          use.useScopeId)
+        astDefn = info.ast.modules[0].definitions[0].members[1]
+        use = info.getUseInfo(astDefn.body)
+        self.assertEquals(info.getScope(astDefn).scopeId, use.useScopeId)
         self.assertEquals(USE_AS_VALUE, use.kind)
 
     def testUsePrivateChild(self):
@@ -149,9 +150,9 @@ class TestUseAnalysis(TestCaseWithDefinitions):
                  "  private var x: i64\n" + \
                  "  def f(other: C) = other.x"
         info = self.analyzeFromSourceWithTypes(source)
-        use = info.getUseInfo(info.ast.modules[0].definitions[0].members[1].body)
-        self.assertEquals(info.getScope(info.ast.modules[0].definitions[0].members[1]).scopeId,
-                          use.useScopeId)
+        astDefn = info.ast.modules[0].definitions[0].members[1]
+        use = info.getUseInfo(astDefn.body)
+        self.assertEquals(info.getScope(astDefn).scopeId, use.useScopeId)
         self.assertEquals(USE_AS_PROPERTY, use.kind)
 
     def testUseProtectedOuter(self):
@@ -190,18 +191,18 @@ class TestUseAnalysis(TestCaseWithDefinitions):
         source = "class Foo(x: i64)\n" + \
                  "class Bar(y: i64) <: Foo(y)"
         info = self.analyzeFromSourceWithTypes(source)
-        fooPrimaryCtorDefnInfo = \
-          info.getDefnInfo(info.ast.modules[0].definitions[0].constructor)
-        use = info.getUseInfo(info.ast.modules[0].definitions[1])
+        definitions = info.ast.modules[0].definitions
+        fooPrimaryCtorDefnInfo = info.getDefnInfo(definitions[0].constructor)
+        use = info.getUseInfo(definitions[1])
         self.assertIs(fooPrimaryCtorDefnInfo, use.defnInfo)
 
     def testUseSuperCtorFromDefaultCtor(self):
         source = "class Foo(x: i64)\n" + \
                  "class Bar <: Foo(12)"
         info = self.analyzeFromSourceWithTypes(source)
-        fooPrimaryCtorDefnInfo = \
-          info.getDefnInfo(info.ast.modules[0].definitions[0].constructor)
-        use = info.getUseInfo(info.ast.modules[0].definitions[1])
+        definitions = info.ast.modules[0].definitions
+        fooPrimaryCtorDefnInfo = info.getDefnInfo(definitions[0].constructor)
+        use = info.getUseInfo(definitions[1])
         self.assertIs(fooPrimaryCtorDefnInfo, use.defnInfo)
 
     def testUseSuperCtorImplicit(self):
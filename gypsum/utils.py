@@ -8,6 +8,13 @@ import os.path
 import string
 import sys
 from StringIO import StringIO
+import yaml
+
+# PyYAML only provides the libyaml-based loader when it was built against libyaml.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 def each(f, iterable):
@@ -192,6 +199,25 @@ def openCommonFile(name):
     return open(file_name)
 
 
+_commonYamlDocuments = {}
+
+def loadCommonYaml(name):
+    """Loads a YAML file installed alongside the compiler.
+
+    Each file is parsed at most once per process. builtins.yaml in particular is needed by
+    both `bytecode` and `builtins`. Callers share the returned documents, so they must not
+    modify them.
+
+    Returns:
+        ([*]): a list of the documents in the file.
+    """
+    if name not in _commonYamlDocuments:
+        with openCommonFile(name) as yamlFile:
+            _commonYamlDocuments[name] = list(yaml.load_all(yamlFile.read(),
+                                                            Loader=_YamlLoader))
+    return _commonYamlDocuments[name]
+
+
 class Counter(object):
     def __init__(self, start=0, inc=1):
         self.n = start
@@ -213,5 +239,5 @@ COMPILE_FOR_UNINITIALIZED = "compile-for-uninitialized"
 
 
 __all__ = ["decodeString", "each", "encodeString", "tryDecodeString", "openCommonFile",
-           "Counter", "hashList", "COMPILE_FOR_VALUE", "COMPILE_FOR_EFFECT",
+           "loadCommonYaml", "Counter", "hashList", "COMPILE_FOR_VALUE", "COMPILE_FOR_EFFECT",
            "COMPILE_FOR_MATCH", "COMPILE_FOR_UNINITIALIZED", "iterOpt", "listOpt"]
@@ -4,6 +4,7 @@
 # the GPL license that can be found in the LICENSE.txt file.
 
 
+import itertools
 import unittest
 
 from ids import DefnId, TARGET_PACKAGE_ID
@@ -11,41 +12,43 @@ from ir import Class, Global, Field, Function, IrTopDefn, LOCAL, Name, Package,
 from ir_types import getNothingClassType, getRootClassType
 from location import NoLoc
 from package_loader import BasePackageLoader
-from utils import Counter, reprFormat
-
-
-OPTION_SOURCE = "public abstract class Option[static +T]\n" + \
-                "  public abstract def is-defined: boolean\n" + \
-                "  public abstract def get: T\n" + \
-                "public class Some[static +T](value: T) <: Option[T]\n" + \
-                "  public override def is-defined = true\n" + \
-                "  public override def get = value\n" + \
-                "  public static def try-match(obj: Object): Option[Object] =\n" + \
-                "    match (obj)\n" + \
-                "      case some: Some[_] => some\n" + \
-                "      case _ => None\n" + \
-                "class None-class <: Option[Nothing]\n" + \
-                "  public override def is-defined = false\n" + \
-                "  public override def get = throw Exception()\n" + \
-                "public let None: Option[Nothing] = None-class()\n"
+from utils import reprFormat
+
+
+OPTION_SOURCE = ("public abstract class Option[static +T]\n"
+                 "  public abstract def is-defined: boolean\n"
+                 "  public abstract def get: T\n"
+                 "public class Some[static +T](value: T) <: Option[T]\n"
+                 "  public override def is-defined = true\n"
+                 "  public override def get = value\n"
+                 "  public static def try-match(obj: Object): Option[Object] =\n"
+                 "    match (obj)\n"
+                 "      case some: Some[_] => some\n"
+                 "      case _ => None\n"
+                 "class None-class <: Option[Nothing]\n"
+                 "  public override def is-defined = false\n"
+                 "  public override def get = throw Exception()\n"
+                 "public let None: Option[Nothing] = None-class()\n")
 
 TUPLE_SOURCE = "class Tuple2[static +T1, static +T2](public _1: T1, public _2: T2)\n"
 
-FUNCTION_SOURCE = "trait Function0[static +R]\n" + \
-                  "  public def call: R\n" + \
-                  "trait Function1[static +R, static -P1]\n" + \
-                  "  public def call(p1: P1): R\n" + \
-                  "trait Function2[static +R, static -P1, static -P2]\n" + \
-                  "  public def call(p1: P1, p2: P2): R\n"
+FUNCTION_SOURCE = ("trait Function0[static +R]\n"
+                   "  public def call: R\n"
+                   "trait Function1[static +R, static -P1]\n"
+                   "  public def call(p1: P1): R\n"
+                   "trait Function2[static +R, static -P1, static -P2]\n"
+                   "  public def call(p1: P1, p2: P2): R\n")
 
 
 class TestCaseWithDefinitions(unittest.TestCase):
     def setUp(self):
-        self.globalCounter = Counter()
-        self.functionCounter = Counter()
-        self.classCounter = Counter()
-        self.traitCounter = Counter()
-        self.typeParameterCounter = Counter()
+        # Bound `next` methods of `itertools.count` are called like `Counter` objects, but
+        # they run in C.
+        self.globalCounter = itertools.count().next
+        self.functionCounter = itertools.count().next
+        self.classCounter = itertools.count().next
+        self.traitCounter = itertools.count().next
+        self.typeParameterCounter = itertools.count().next
 
     def tearDown(self):
         self.globalCounter = None
@@ -97,16 +100,18 @@ class TestCaseWithDefinitions(unittest.TestCase):
 class FakePackageLoader(BasePackageLoader):
     def __init__(self, packagesOrPackageNames):
         super(FakePackageLoader, self).__init__()
-        if len(packagesOrPackageNames) == 0:
-            self.packageNames = []
-            self.packages = {}
-        elif isinstance(packagesOrPackageNames[0], Package):
-            self.packageNames = [p.name for p in packagesOrPackageNames]
-            self.packages = {p.name: p for p in packagesOrPackageNames}
-        else:
-            assert isinstance(packagesOrPackageNames[0], Name)
-            self.packageNames = packagesOrPackageNames
-            self.packages = {name: Package(name=name) for name in packagesOrPackageNames}
+        self.packageNames = []
+        self.packages = {}
+        self.packagesById = {}
+        for packageOrName in packagesOrPackageNames:
+            if isinstance(packageOrName, Package):
+                package = packageOrName
+            else:
+                assert isinstance(packageOrName, Name)
+                package = Package(name=packageOrName)
+            self.packageNames.append(package.name)
+            self.packages[package.name] = package
+            self.packagesById[package.id] = package
         self.loadedIds = set()
 
     def getPackageNames(self):
@@ -118,7 +123,9 @@ class FakePackageLoader(BasePackageLoader):
     def loadPackage(self, name, loc=NoLoc):
         assert name in self.packageNames
         if name not in self.packages:
-            self.packages[name] = Package(name=name)
+            package = Package(name=name)
+            self.packages[name] = package
+            self.packagesById[package.id] = package
         package = self.packages[name]
 
         if package.id not in self.loadedIds:
@@ -132,7 +139,7 @@ class FakePackageLoader(BasePackageLoader):
         return map(self.getPackageById, self.loadedIds)
 
     def getPackageById(self, id):
-        return next(package for package in self.packages.itervalues() if package.id is id)
+        return self.packagesById[id]
 
 
 class TestDefn(object):
@@ -157,13 +164,12 @@ class TestDefn(object):
         """The actual init function intended to be called when a test definition is constructed.
 
         This will call the real init function, and will also set some internal properties."""
-        if (isinstance(self, IrTopDefn) or isinstance(self, TypeParameter)) \
-            and "id" not in kwargs:
+        if isinstance(self, (IrTopDefn, TypeParameter)) and "id" not in kwargs:
             super(TestDefn, self).__init__(name, _id, **kwargs)
         else:
             super(TestDefn, self).__init__(name, **kwargs)
         self.test = test
-        self.propNames = frozenset(kwargs.keys())
+        self.propNames = frozenset(kwargs)
 
     def __repr__(self):
         pairStrs = ("%s=%s" % (key, getattr(self, key)) for key in self.propNames)